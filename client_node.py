@@ -2,24 +2,37 @@
 ClientNode: nó cliente "inteligente" que implementa:
 - Exclusão mútua distribuída via Ricart–Agrawala (RA) com deferência explícita
 - Relógios Lógicos de Lamport
-- gRPC para conversar com outros clientes (RequestAccess/ReleaseAccess) e com o "servidor de impressão burro"
+- gRPC para conversar com outros clientes (MutexStream, com RequestAccess/ReleaseAccess também
+  disponíveis como RPCs unárias) e com o "servidor de impressão burro"
 
 Observação de projeto:
 - A deferência explícita é feita retendo o retorno do RPC RequestAccess enquanto:
   (a) estou na seção crítica (HELD), ou
   (b) estou querendo entrar (WANTED) e meu pedido tem prioridade sobre o do chamador.
 - A prioridade segue (lamport_timestamp, client_id) — menor vence; empate pelo id.
+- O servidor RA é síncrono (pool de threads) de propósito: a deferência mantém o handler
+  de RequestAccess parado na Condition até a saída da CS, então cada peer deferido ocupa
+  uma thread. Por isso o pool nunca tem menos que len(peers) + 1 threads; os handlers em
+  si são O(1) (um tick/update de Lamport e a checagem de prioridade).
+- Entre clientes, pedidos e liberações trafegam por um MutexStream persistente por peer
+  (um stream HTTP/2 aberto uma vez, em vez de um por mensagem). Do lado servidor o stream
+  é atendido por uma thread que processa as mensagens do peer em ordem, deferindo como
+  no RequestAccess unário.
 """
 
 from __future__ import annotations
 
 import argparse
+import itertools
+import queue
 import random
+import sys
 import threading
 import time
+from collections import deque
 from concurrent import futures
 from enum import Enum
-from typing import Optional, Tuple, Dict, List
+from typing import Any, Callable, Deque, Optional, Tuple, Dict, List
 
 import grpc
 import distributed_printing_pb2 as pb2
@@ -29,31 +42,83 @@ import distributed_printing_pb2_grpc as pb2_grpc
 # ==========================
 # Constantes de configuração
 # ==========================
-# Tempo máximo que um peer pode segurar a resposta do RequestAccess (deferência) antes do solicitante estourar timeout.
+# Tempo mínimo esperando os ACKs de uma rodada (inclui o tempo em que os peers seguram a resposta
+# por deferência). O prazo efetivo cresce com o pior caso de espera: cada peer à frente pode
+# segurar a CS por um lote inteiro, ou seja, len(peers) × max_batch × PRINTER_TIMEOUT_SEC.
 ACK_TIMEOUT_SEC: float = 120.0
 
-# Tempo máximo para enviar o ReleaseAccess e não travar finalização.
-RELEASE_TIMEOUT_SEC: float = 5.0
-
 # Tempo máximo para esperar resposta do servidor de impressão "burro".
 PRINTER_TIMEOUT_SEC: float = 15.0
 
+# Máximo de jobs da fila impressos em uma mesma rodada de RA (uma entrada na CS).
+MAX_PRINT_BATCH: int = 8
+
+# Espera antes de reabrir um MutexStream rejeitado por sobrecarga (RESOURCE_EXHAUSTED).
+OVERLOAD_RETRY_SEC: float = 0.05
+
+# Prazo para o canal de um peer ficar pronto após um stream falhar com UNAVAILABLE,
+# antes de o peer ser tratado como caído (cobre o backoff de reconexão do gRPC).
+PEER_READY_TIMEOUT_SEC: float = 2.0
+
+# Threads do servidor gRPC local (pool fixo). O default é 2 × peers + 4 (o MutexStream
+# de cada peer e RPCs unárias avulsas, com folga), nunca abaixo deste mínimo. Mesmo se
+# configurado à mão, o pool nunca fica menor que len(peers) + 1: cada stream de peer
+# prende uma thread.
+MIN_GRPC_THREADS: int = 8
+
+# Keepalive dos canais: pings mantêm viva (ou revelam morta) a conexão ociosa com um peer,
+# em vez de o próximo RequestAccess descobrir no caminho crítico que NAT/proxy a derrubou.
+CHANNEL_OPTIONS: List[Tuple[str, int]] = [
+    ("grpc.keepalive_time_ms", 10000),
+    ("grpc.keepalive_timeout_ms", 3000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    # Teto do backoff de reconexão (default do gRPC: 120 s). Precisa ficar abaixo de
+    # PEER_READY_TIMEOUT_SEC, senão um peer que reiniciou ainda não estaria conectado
+    # ao fim da espera em _wait_ready e seria creditado sem ter respondido.
+    ("grpc.max_reconnect_backoff_ms", 1000),
+]
+
+# Lado servidor: os mesmos pings na direção contrária, para perceber rápido um peer que
+# caiu com um RequestAccess deferido; e aceita os pings dos clientes mesmo sem chamadas
+# ativas (o default do gRPC responderia com GOAWAY "too_many_pings").
+SERVER_OPTIONS: List[Tuple[str, int]] = [
+    ("grpc.keepalive_time_ms", 10000),
+    ("grpc.keepalive_timeout_ms", 3000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_ping_interval_without_data_ms", 5000),
+]
+
 
 # ========================================
 # Relógio de Lamport (thread-safe / simples)
 # ========================================
 class LamportClock:
-    """Relógio lógico de Lamport com operações atômicas."""
+    """
+    Relógio lógico de Lamport.
 
-    def __init__(self) -> None:
-        self._ts: int = 0
-        self._lock = threading.Lock()
+    tick() e update_on_recv() fazem leitura-modificação-escrita sob o mesmo lock:
+    sem ele, um tick concorrente com um ajuste por recebimento poderia emitir o
+    mesmo timestamp duas vezes. A seção crítica é só uma soma/max.
+
+    O lock pode ser externo (o ClientNode passa o state_lock); quem já o detém
+    usa as variantes *_locked, sem uma segunda aquisição.
+    """
+
+    def __init__(self, lock: Optional[threading.Lock] = None) -> None:
+        self._ts: int = 0  # último valor emitido
+        self._lock = lock or threading.Lock()
 
     def tick(self) -> int:
         """Evento local: incrementa o relógio e retorna o novo valor."""
         with self._lock:
-            self._ts += 1
-            return self._ts
+            return self.tick_locked()
+
+    def tick_locked(self) -> int:
+        """Como tick(), para quem já detém o lock do relógio."""
+        self._ts += 1
+        return self._ts
 
     def update_on_recv(self, incoming_ts: int) -> int:
         """
@@ -61,14 +126,181 @@ class LamportClock:
         e retorna o novo valor.
         """
         with self._lock:
-            self._ts = max(self._ts, incoming_ts) + 1
-            return self._ts
+            return self.update_on_recv_locked(incoming_ts)
+
+    def update_on_recv_locked(self, incoming_ts: int) -> int:
+        """Como update_on_recv(), para quem já detém o lock do relógio."""
+        self._ts = max(self._ts, incoming_ts) + 1
+        return self._ts
 
     @property
     def value(self) -> int:
-        """Leitura segura do timestamp atual."""
+        """Leitura do timestamp atual (sem lock; serve para observabilidade)."""
+        return self._ts
+
+
+# ==========================================================
+# Stub de exclusão mútua com requisições pré-serializadas
+# ==========================================================
+class PreSerializedMutexStub:
+    """
+    Equivalente ao MutualExclusionServiceStub gerado (só o MutexStream, o único
+    usado pelo cliente), mas recebe as mensagens já serializadas (bytes). No
+    broadcast a mesma mensagem vai para todos os peers: serializamos uma vez por
+    rodada em vez de uma vez por peer.
+    """
+
+    def __init__(self, channel: grpc.Channel) -> None:
+        # request_serializer=None: o gRPC envia os bytes como estão.
+        self.MutexStream = channel.stream_stream(
+            "/distributed_printing.MutualExclusionService/MutexStream",
+            request_serializer=None,
+            response_deserializer=pb2.MutexMessage.FromString,
+        )
+
+
+# ====================================
+# ACKs de uma rodada de RequestAccess
+# ====================================
+class AckRound:
+    """
+    Contabiliza os ACKs de uma rodada sem lock global.
+
+    Cada peer tem um slot fixo em `awaiting`, escrito apenas pela leitura do stream
+    daquele peer; o total recebido vem de itertools.count (next() é atômico sob
+    o GIL). Um ACK atrasado de rodada antiga só altera o próprio objeto.
+    """
+
+    def __init__(self, n_peers: int) -> None:
+        self.awaiting = bytearray(b"\x01" * n_peers)
+        self.done = threading.Event()
+        self._total = n_peers
+        self._received = itertools.count(1)
+        if n_peers == 0:
+            self.done.set()  # sem peers não há ACK a esperar
+
+    def ack(self, slot: int) -> None:
+        """Registra o ACK do peer `slot`; dispara `done` no último."""
+        if not self.awaiting[slot]:
+            return
+        self.awaiting[slot] = 0
+        if next(self._received) == self._total:
+            self.done.set()
+
+    @property
+    def pending(self) -> int:
+        """ACKs ainda em aberto (leitura aproximada, para observabilidade)."""
+        return self.awaiting.count(1)
+
+
+# ===============================================
+# Stream persistente de exclusão mútua com um peer
+# ===============================================
+class PeerLink:
+    """
+    Mantém um MutexStream aberto com um peer e envia por ele pedidos e liberações
+    (já serializados). As respostas voltam na ordem dos pedidos, então cada uma
+    credita o ACK do pedido pendente mais antigo.
+
+    Se o stream cair, os pedidos pendentes são creditados (mesma tolerância didática
+    de antes para peer que cai) e o próximo envio abre um stream novo. Se o peer
+    rejeitar o stream por sobrecarga (RESOURCE_EXHAUSTED), nada foi processado:
+    os pedidos são reenviados em vez de contabilizados. O mesmo vale para
+    UNAVAILABLE quando o canal volta a ficar pronto logo em seguida (peer que
+    acabou de subir, com o canal ainda no backoff de reconexão). Só quando essa
+    espera esgota os pedidos são creditados; ela é repetida a cada queda, inclusive
+    de um peer que já estava fora, para que um peer reiniciado volte a ser consultado.
+    """
+
+    def __init__(self, channel: grpc.Channel, on_response: Callable[[int], Any]) -> None:
+        self._channel = channel
+        self._stub = PreSerializedMutexStub(channel)
+        self._on_response = on_response  # recebe o lamport_timestamp de cada resposta
+        self._lock = threading.Lock()  # protege _outbox e _pending
+        self._outbox: Optional["queue.SimpleQueue[Optional[bytes]]"] = None  # None = sem stream
+        self._pending: Deque[Tuple[AckRound, int, bytes]] = deque()
+        self._closed = False  # após close() nada mais é enviado (canal encerrado)
+
+    def send_request(self, acks: AckRound, slot: int, payload: bytes) -> None:
+        """Envia um pedido; o ACK entra em `acks` quando a resposta chegar."""
+        with self._lock:
+            if self._closed:
+                return
+            outbox = self._open()
+            self._pending.append((acks, slot, payload))
+            outbox.put(payload)
+
+    def send_release(self, payload: bytes) -> None:
+        """Envia uma liberação (sem resposta)."""
+        with self._lock:
+            if not self._closed:
+                self._open().put(payload)
+
+    def close(self) -> None:
+        """Encerra o lado de envio do stream atual, se houver, e os envios futuros."""
+        with self._lock:
+            self._closed = True
+            if self._outbox is not None:
+                self._outbox.put(None)
+                self._outbox = None
+
+    def _open(self) -> "queue.SimpleQueue[Optional[bytes]]":
+        """Stream atual, aberto se preciso (chamado com _lock)."""
+        if self._outbox is None:
+            outbox: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+            responses = self._stub.MutexStream(iter(outbox.get, None))
+            threading.Thread(target=self._read, args=(outbox, responses), daemon=True).start()
+            self._outbox = outbox
+        return self._outbox
+
+    def _wait_ready(self) -> bool:
+        """True se o canal do peer ficar pronto em até PEER_READY_TIMEOUT_SEC."""
+        ready = grpc.channel_ready_future(self._channel)
+        try:
+            ready.result(timeout=PEER_READY_TIMEOUT_SEC)
+            return True
+        except grpc.FutureTimeoutError:
+            ready.cancel()
+            return False
+
+    def _read(self, outbox: "queue.SimpleQueue[Optional[bytes]]", responses: Any) -> None:
+        """Lê as respostas do stream até ele terminar."""
+        code = None
+        try:
+            for msg in responses:
+                self._on_response(msg.response.lamport_timestamp)
+                with self._lock:
+                    acks, slot, _ = self._pending.popleft()
+                acks.ack(slot)
+        except grpc.RpcError as e:
+            code = e.code()
+        except Exception:
+            pass
+
         with self._lock:
-            return self._ts
+            if self._outbox is outbox:
+                self._outbox = None
+            outbox.put(None)  # encerra o iterador de envio do stream que terminou
+            orphaned = list(self._pending)
+            self._pending.clear()
+
+        if code == grpc.StatusCode.RESOURCE_EXHAUSTED:
+            # Peer sobrecarregado rejeitou sem processar: isso NÃO é um ACK.
+            # Reenvia em vez de contabilizar, senão dois nós poderiam entrar na CS.
+            time.sleep(OVERLOAD_RETRY_SEC)
+            retry = True
+        elif orphaned and code == grpc.StatusCode.UNAVAILABLE:
+            retry = self._wait_ready()
+        else:
+            retry = False
+        if retry:
+            for acks, slot, payload in orphaned:
+                self.send_request(acks, slot, payload)
+            return
+        # Tolerância didática: se um peer cair, não travamos para sempre.
+        # Em produção, preferir membership/remoção do conjunto de peers.
+        for acks, slot, _ in orphaned:
+            acks.ack(slot)
 
 
 # ===========================
@@ -87,8 +319,9 @@ class ClientNode(pb2_grpc.MutualExclusionServiceServicer):
     """
     Implementa o serviço MutualExclusionService de RA para receber solicitações dos peers,
     e também atua como cliente gRPC para:
-      - pedir acesso aos peers (RequestAccess)
-      - notificar liberação aos peers (ReleaseAccess)
+      - pedir acesso aos peers e notificar a liberação, ambos pelo MutexStream persistente
+        de cada peer (RequestAccess/ReleaseAccess unários seguem atendidos só do lado
+        servidor, por compatibilidade)
       - enviar a impressão ao servidor burro (PrintingService)
     """
 
@@ -99,27 +332,49 @@ class ClientNode(pb2_grpc.MutualExclusionServiceServicer):
         port: int,
         peers: List[str],
         printer_addr: str,
+        grpc_threads: Optional[int] = None,
+        grpc_max_pending: Optional[int] = None,
+        max_batch: int = MAX_PRINT_BATCH,
     ) -> None:
         # Identificação e networking
         self.client_id: int = client_id
         self.host: str = host
         self.port: int = port
-        self.peers: List[str] = peers  # lista "host:port" de OUTROS clientes
+        # Lista "host:port" de OUTROS clientes, ordenada e sem repetição: a posição de cada
+        # peer é o seu slot, usado como índice em todas as estruturas por peer.
+        self.peers: List[str] = sorted(set(peers))
         self.printer_addr: str = printer_addr
 
-        # Canais/stubs para peers (MutualExclusionService) e impressora (PrintingService)
-        self._peer_stubs: Dict[str, pb2_grpc.MutualExclusionServiceStub] = {}
-        for peer in self.peers:
-            ch = grpc.insecure_channel(peer)
-            self._peer_stubs[peer] = pb2_grpc.MutualExclusionServiceStub(ch)
-
-        self._printer_channel = grpc.insecure_channel(self.printer_addr)
-        self._printer_stub = pb2_grpc.PrintingServiceStub(self._printer_channel)
-
-        # Algoritmo RA + Lamport
-        self.clock = LamportClock()
+        # Dimensionamento do servidor gRPC local
+        default_threads = max(MIN_GRPC_THREADS, 2 * len(self.peers) + 4)
+        self.grpc_threads: int = max(grpc_threads or default_threads, len(self.peers) + 1)
+        # Limite de RPCs em andamento; acima dele o gRPC rejeita na hora com
+        # RESOURCE_EXHAUSTED em vez de enfileirar. Cada peer mantém um MutexStream
+        # aberto (e eventualmente RPCs unárias avulsas), então o default tem folga.
+        # Mesmo se configurado à mão, nunca fica abaixo de len(peers) + 1: com menos,
+        # o stream de algum peer seria rejeitado para sempre.
+        self.grpc_max_pending: int = max(grpc_max_pending or 4 * (len(self.peers) + 1), len(self.peers) + 1)
+
+        # Canais/stubs para peers (MutualExclusionService) e impressora (PrintingService).
+        # Todos os canais saem do mesmo cache: serviços no mesmo endpoint dividem a conexão.
+        self._channel_cache: Dict[str, grpc.Channel] = {}
+        self._printer_stub = pb2_grpc.PrintingServiceStub(self._get_channel(self.printer_addr))
+
+        # Algoritmo RA + Lamport. O relógio usa o próprio state_lock: a transição para
+        # WANTED com o tick do pedido, e no servicer o ajuste pelo pedido recebido com
+        # a regra de deferência, ficam cada um em uma única aquisição de lock.
         self.state: RAState = RAState.RELEASED
-        self.state_lock = threading.Lock()  # protege state, my_request, pending_acks
+        self.state_lock = threading.Lock()  # protege state, my_request e o relógio
+        self.clock = LamportClock(self.state_lock)
+
+        # Um MutexStream por peer, aberto no primeiro envio sobre o canal do peer.
+        # O conjunto de peers é fixo após a construção: tuplas imutáveis, com os
+        # pares (slot, link) já montados para o broadcast.
+        self._peer_links: Tuple[PeerLink, ...] = tuple(
+            PeerLink(self._get_channel(peer), self.clock.update_on_recv)
+            for peer in self.peers
+        )
+        self._peer_slots: Tuple[Tuple[int, PeerLink], ...] = tuple(enumerate(self._peer_links))
 
         # Pedido atual do nó: (lamport_ts, client_id, request_number)
         self.my_request: Optional[Tuple[int, int, int]] = None
@@ -128,13 +383,32 @@ class ClientNode(pb2_grpc.MutualExclusionServiceServicer):
         # Condition para deferência explícita (bloquear respostas a peers)
         self._cond = threading.Condition(self.state_lock)
 
-        # Acks em aberto e evento para aguardar todos
-        self.pending_acks: int = 0
-        self.all_acks_event = threading.Event()
+        # ACKs da rodada atual (substituído a cada broadcast)
+        self._acks = AckRound(0)
+
+        # Fila de jobs gerados aguardando impressão (drenada em lotes por rodada de RA).
+        # Limitada a um lote: com ela cheia o gerador espera, em vez de acumular jobs
+        # mais rápido do que a impressora (exclusiva) consegue atender.
+        self.max_batch: int = max(1, max_batch)
+        self._pending: "queue.Queue[str]" = queue.Queue(maxsize=self.max_batch)
+        # Prazo dos ACKs: com lotes, cada peer à frente pode ficar na CS por até
+        # max_batch impressões; um prazo fixo faria o nó desistir (e voltar ao fim da
+        # fila com um timestamp maior) justamente quando os peers estão saturados.
+        self.ack_timeout: float = max(
+            ACK_TIMEOUT_SEC, len(self.peers) * self.max_batch * PRINTER_TIMEOUT_SEC
+        )
 
         # Métrica simples
         self._jobs_sent: int = 0
 
+    def _get_channel(self, target: str) -> grpc.Channel:
+        """Canal para `target`, criado uma única vez e compartilhado por todos os stubs."""
+        ch = self._channel_cache.get(target)
+        if ch is None:
+            ch = grpc.insecure_channel(target, options=CHANNEL_OPTIONS)
+            self._channel_cache[target] = ch
+        return ch
+
     # =====================================================
     # Métodos do serviço gRPC (servidor): recebendo de peers
     # =====================================================
@@ -146,31 +420,48 @@ class ClientNode(pb2_grpc.MutualExclusionServiceServicer):
           - Se EU estiver WANTED e MEU pedido tiver prioridade -> bloqueio a resposta (deferir).
           - Caso contrário -> respondo imediatamente com ACK.
         """
-        # Ajuste de Lamport com timestamp recebido
-        self.clock.update_on_recv(request.lamport_timestamp)
+        return self._grant_when_allowed(request, context, registered=False)
 
-        peer_id = request.client_id
-        their_req = (request.lamport_timestamp, peer_id, request.request_number)
+    def _grant_when_allowed(self, request: pb2.AccessRequest, context, registered: bool) -> pb2.AccessResponse:
+        """
+        Aplica a regra de deferência a um pedido (unário ou vindo do MutexStream) e
+        retorna o ACK quando ele puder ser dado. `registered` indica que o callback de
+        término da RPC já foi registrado no `context`.
+        """
+        their_ts = request.lamport_timestamp
+        their_id = request.client_id
 
         with self._cond:
-            while True:
-                # 1) Estou NA seção crítica? Então ninguém entra -> espero sair.
-                if self.state == RAState.HELD:
-                    self._cond.wait(timeout=0.1)
-                    continue
-
-                # 2) Estou QUERENDO entrar e meu pedido tem maior prioridade que o do peer?
-                #    Se sim, aguardo até eu terminar (mantém o peer esperando).
-                if self.state == RAState.WANTED and self._is_my_request_higher_priority_than(their_req):
-                    self._cond.wait(timeout=0.1)
-                    continue
-
-                # 3) Caso contrário, posso responder agora.
-                break
+            # Ajuste de Lamport com timestamp recebido (o relógio usa este mesmo lock)
+            self.clock.update_on_recv_locked(their_ts)
+
+            # Espera sem polling: toda saída de HELD/WANTED passa por _set_released,
+            # que sempre faz notify_all. O while reavalia a regra a cada despertar
+            # (inclusive despertares espúrios).
+            #  1) Estou NA seção crítica? Então ninguém entra -> espero sair.
+            #  2) Estou QUERENDO entrar e meu pedido tem maior prioridade que o do peer?
+            #     Se sim, aguardo até eu terminar (mantém o peer esperando).
+            while self.state == RAState.HELD or (
+                self.state == RAState.WANTED and self._is_my_request_higher_priority_than(their_ts, their_id)
+            ):
+                # Se a RPC terminar por fora (timeout do peer, cancelamento, keepalive
+                # detectou queda), o callback acorda este handler para liberar a thread
+                # já, em vez de segurá-la até a minha saída da CS.
+                if not registered:
+                    registered = context.add_callback(self._wake_deferred)
+                if not registered or not context.is_active():
+                    return pb2.AccessResponse()  # ninguém mais aguarda esta resposta
+                self._cond.wait()
+
+            # 3) Caso contrário, posso responder agora.
 
             # Tick ao enviar a resposta (evento local)
-            self.clock.tick()
-            return pb2.AccessResponse(access_granted=True, lamport_timestamp=self.clock.value)
+            return pb2.AccessResponse(access_granted=True, lamport_timestamp=self.clock.tick_locked())
+
+    def _wake_deferred(self) -> None:
+        """Callback de término de uma RPC deferida: acorda os handlers para reavaliarem."""
+        with self._cond:
+            self._cond.notify_all()
 
     def ReleaseAccess(self, request: pb2.AccessRelease, context) -> pb2.Empty:
         """
@@ -181,83 +472,85 @@ class ClientNode(pb2_grpc.MutualExclusionServiceServicer):
         self.clock.update_on_recv(request.lamport_timestamp)
         return pb2.Empty()
 
+    def MutexStream(self, request_iterator, context):
+        """
+        Stream persistente de um peer: processa pedidos e liberações na ordem em que
+        chegam. Cada pedido recebe a sua resposta (possivelmente deferida) antes da
+        próxima mensagem ser lida; o peer só libera depois de receber o meu ACK.
+        """
+        # Um único callback por stream (e não por pedido deferido) acorda os handlers
+        # quando o stream terminar.
+        registered = context.add_callback(self._wake_deferred)
+        for msg in request_iterator:
+            kind = msg.WhichOneof("body")
+            if kind == "request":
+                resp = self._grant_when_allowed(msg.request, context, registered)
+                if not context.is_active():
+                    return
+                yield pb2.MutexMessage(response=resp)
+            elif kind == "release":
+                self.clock.update_on_recv(msg.release.lamport_timestamp)
+
     # ===========================================
     # Auxiliar: prioridade (menor ts; desempate id)
     # ===========================================
-    def _is_my_request_higher_priority_than(self, their_req: Tuple[int, int, int]) -> bool:
+    def _is_my_request_higher_priority_than(self, their_ts: int, their_id: int) -> bool:
         """
         Retorna True se MEU pedido atual tem prioridade sobre o do peer:
           - prioridade por menor timestamp
           - em empate, menor client_id
+        Equivale a (my_ts, client_id) < (their_ts, their_id), sem montar tuplas.
         """
         my_req = self.my_request
         if my_req is None:
             return False
-        return (my_req[0], my_req[1]) < (their_req[0], their_req[1])
+        my_ts = my_req[0]
+        return my_ts < their_ts or (my_ts == their_ts and self.client_id < their_id)
 
     # ==================================================
     # Cliente: broadcast de RequestAccess e ReleaseAccess
     # ==================================================
-    def _broadcast_request(self) -> None:
-        """Envia RequestAccess a todos os peers e aguarda ACKs (via evento)."""
-        self.pending_acks = len(self.peers)
-        self.all_acks_event.clear()
+    @property
+    def pending_acks(self) -> int:
+        """ACKs em aberto na rodada atual (para o status)."""
+        return self._acks.pending
 
+    def _broadcast_request(self, ts: int) -> AckRound:
+        """
+        Envia RequestAccess a todos os peers com o timestamp `ts` do meu pedido;
+        os ACKs são contabilizados na rodada retornada.
+        """
+        acks = self._acks = AckRound(len(self.peers))
+        if not self._peer_slots:
+            return acks  # nó sozinho: a rodada já nasce completa
+
+        # O timestamp enviado é o mesmo de my_request: os peers precisam comparar
+        # exatamente o pedido que eu uso na minha própria regra de prioridade.
         req = pb2.AccessRequest(
             client_id=self.client_id,
-            lamport_timestamp=self.clock.tick(),  # evento local ao enviar
+            lamport_timestamp=ts,
             request_number=self.request_number,
         )
 
-        for peer_addr, stub in self._peer_stubs.items():
-            # Cada request vai em uma thread para não bloquear o chamador
-            t = threading.Thread(
-                target=self._send_request_to_peer,
-                args=(stub, peer_addr, req),
-                daemon=True,
-            )
-            t.start()
-
-    def _send_request_to_peer(
-        self,
-        stub: pb2_grpc.MutualExclusionServiceStub,
-        peer_addr: str,
-        req: pb2.AccessRequest,
-    ) -> None:
-        """Faz a chamada RPC a um peer e contabiliza o ACK (com tolerância a falhas)."""
-        try:
-            # O peer pode segurar a resposta (deferência) por estar HELD/WANTED.
-            resp = stub.RequestAccess(req, timeout=ACK_TIMEOUT_SEC)
-            self.clock.update_on_recv(resp.lamport_timestamp)
-        except Exception:
-            # Tolerância didática: se um peer cair, não travamos para sempre.
-            # Em produção, preferir membership/remoção do conjunto de peers.
-            pass
-        finally:
-            # Contabiliza o ACK (ou tolerância) e dispara o evento quando zerar.
-            with self.state_lock:
-                self.pending_acks -= 1
-                if self.pending_acks == 0:
-                    self.all_acks_event.set()
+        # Uma serialização para todos os peers. O envio só enfileira no stream de cada
+        # peer; as respostas (possivelmente deferidas) creditam `acks` ao chegar.
+        payload = pb2.MutexMessage(request=req).SerializeToString()
+        for slot, link in self._peer_slots:
+            link.send_request(acks, slot, payload)
+        return acks
 
     def _broadcast_release(self) -> None:
-        """Notifica todos os peers de que sai da CS."""
+        """Notifica todos os peers de que sai da CS (sem aguardar as respostas)."""
+        if not self._peer_links:
+            return
         rel = pb2.AccessRelease(
             client_id=self.client_id,
             lamport_timestamp=self.clock.tick(),
             request_number=self.request_number,
         )
-        for stub in self._peer_stubs.values():
-            t = threading.Thread(target=self._safe_release, args=(stub, rel), daemon=True)
-            t.start()
-
-    @staticmethod
-    def _safe_release(stub: pb2_grpc.MutualExclusionServiceStub, rel: pb2.AccessRelease) -> None:
-        """Chamada ReleaseAccess tolerante a falhas/timeout (não deve travar a saída)."""
-        try:
-            stub.ReleaseAccess(rel, timeout=RELEASE_TIMEOUT_SEC)
-        except Exception:
-            pass
+        payload = pb2.MutexMessage(release=rel).SerializeToString()  # uma serialização para todos
+        for link in self._peer_links:
+            link.send_release(payload)
 
     # ==========================
     # Seção crítica: impressão
@@ -280,37 +573,81 @@ class ClientNode(pb2_grpc.MutualExclusionServiceServicer):
         except Exception as e:
             return False, f"Falha ao imprimir: {e}"
 
+    def _critical_section_print_batch(self, contents: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Envia várias mensagens ao servidor "burro" em uma única chamada (client-streaming),
+        todas com o mesmo timestamp de Lamport. Retorna um (sucesso, mensagem) por item;
+        os que o servidor não chegou a imprimir voltam como falha.
+        """
+        ts = self.clock.tick()
+        reqs = [
+            pb2.PrintRequest(
+                client_id=self.client_id,
+                message_content=content,
+                lamport_timestamp=ts,
+                request_number=self.request_number,
+            )
+            for content in contents
+        ]
+        try:
+            resp = self._printer_stub.SendManyToPrinter(iter(reqs), timeout=PRINTER_TIMEOUT_SEC * len(reqs))
+            self.clock.update_on_recv(resp.lamport_timestamp)
+        except Exception as e:
+            return [(False, f"Falha ao imprimir: {e}")] * len(contents)
+        printed = min(resp.printed, len(contents))
+        return [(resp.success, resp.confirmation_message)] * printed + [
+            (False, "Não impresso pelo servidor")
+        ] * (len(contents) - printed)
+
     # ==========================================
     # Ciclo completo: pedir -> esperar -> SC -> liberar
     # ==========================================
     def request_and_print(self, content: str) -> Tuple[bool, str]:
         """Fluxo principal de RA + Lamport para imprimir uma mensagem."""
+        return self.request_and_print_batch([content])[0]
+
+    def request_and_print_batch(self, contents: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Imprime várias mensagens com UMA rodada de RA: pede acesso uma vez, envia
+        todas em uma única chamada SendManyToPrinter enquanto está na CS e libera
+        uma vez. O custo de 2(N-1) mensagens da rodada é dividido entre os jobs do lote.
+        """
         # 1) Anunciar intenção (WANTED), registrar meu pedido e broadcast
         with self.state_lock:
             self.state = RAState.WANTED
             self.request_number += 1
-            self.my_request = (self.clock.tick(), self.client_id, self.request_number)
+            ts = self.clock.tick_locked()  # evento de envio do pedido (um único tick)
+            self.my_request = (ts, self.client_id, self.request_number)
 
-        self._broadcast_request()
+        acks = self._broadcast_request(ts)
 
         # 2) Esperar TODOS os ACKs
-        if not self.all_acks_event.wait(timeout=ACK_TIMEOUT_SEC + 60.0):
-            return False, "Timeout aguardando ACKs dos peers"
+        if not acks.done.wait(timeout=self.ack_timeout):
+            # Desiste do pedido: volta a RELEASED e libera quem foi deferido,
+            # senão esses peers ficariam presos aguardando um notify que não viria.
+            self._set_released()
+            return [(False, "Timeout aguardando ACKs dos peers")] * len(contents)
 
         # 3) Entrar na seção crítica
         with self.state_lock:
             self.state = RAState.HELD
 
-        ok, info = self._critical_section_print(content)
+        if len(contents) == 1:
+            results = [self._critical_section_print(contents[0])]
+        else:
+            results = self._critical_section_print_batch(contents)
 
         # 4) Sair da Seção Critica, notificar quem estava deferido e broadcast release
+        self._set_released()
+        self._broadcast_release()
+        return results
+
+    def _set_released(self) -> None:
+        """Volta a RELEASED e acorda os handlers RequestAccess deferidos (única saída de WANTED/HELD)."""
         with self._cond:
             self.state = RAState.RELEASED
             self.my_request = None
-            self._cond.notify_all()  # acorda handlers RequestAccess bloqueados
-
-        self._broadcast_release()
-        return ok, info
+            self._cond.notify_all()
 
     # =====================
     # Utils
@@ -320,40 +657,90 @@ class ClientNode(pb2_grpc.MutualExclusionServiceServicer):
 
         def _loop() -> None:
             while True:
-                with self.state_lock:
-                    st = self.state.name
-                    ts = self.clock.value
-                    p_acks = self.pending_acks
-                print(
+                # Leituras sem state_lock: cada uma é atômica sob o GIL e o status é só
+                # diagnóstico, então um retrato levemente inconsistente entre os campos
+                # é aceitável e não disputa o lock com os handlers de RequestAccess.
+                st = self.state.name
+                ts = self.clock.value
+                p_acks = self.pending_acks
+                # Uma única escrita com a linha pronta (print faria duas: texto e "\n")
+                sys.stdout.write(
                     f"[STATUS] id={self.client_id} ts={ts} "
-                    f"state={st} pendingAcks={p_acks} jobsSent={self._jobs_sent}"
+                    f"state={st} pendingAcks={p_acks} jobsSent={self._jobs_sent}\n"
                 )
                 time.sleep(interval)
 
         threading.Thread(target=_loop, daemon=True).start()
 
-    def start_job_generator(self, min_wait: float = 3.0, max_wait: float = 7.0) -> None:
-        """Gera jobs aleatórios continuamente, simulando requisições de impressão."""
+    def start_job_generator(self, min_wait: float = 3.0, max_wait: float = 7.0, block: bool = False) -> None:
+        """
+        Gera jobs aleatórios continuamente, simulando requisições de impressão.
+        A geração é independente da impressão: os jobs entram na fila e o worker
+        imprime tudo o que já estiver pendente (até max_batch) em uma só rodada de RA.
+        Com a fila cheia o gerador espera o worker drenar (contrapressão).
+        Com block=True o gerador roda na thread chamadora e não retorna.
+        """
 
-        def _loop() -> None:
+        def _produce() -> None:
             while True:
                 time.sleep(random.uniform(min_wait, max_wait))
-                job_msg = f"Hello from client {self.client_id} at {time.time():.0f}"
-                ok, info = self.request_and_print(job_msg)
-                self._jobs_sent += 1
-                if ok:
-                    print(f"[JOB OK] {info}")
-                else:
-                    print(f"[JOB ERR] {info}")
-
-        threading.Thread(target=_loop, daemon=True).start()
+                job = f"Hello from client {self.client_id} at {time.time():.0f}"
+                # put com timeout em laço: a espera pela fila cheia continua
+                # interrompível por Ctrl+C quando roda na thread principal.
+                while True:
+                    try:
+                        self._pending.put(job, timeout=1.0)
+                        break
+                    except queue.Full:
+                        pass
+
+        def _consume() -> None:
+            while True:
+                batch = [self._pending.get()]
+                while len(batch) < self.max_batch:
+                    try:
+                        batch.append(self._pending.get_nowait())
+                    except queue.Empty:
+                        break
+                results = self.request_and_print_batch(batch)
+                self._jobs_sent += len(results)
+                # Jobs do lote com o mesmo resultado (a confirmação do SendManyToPrinter
+                # vale para o lote inteiro) viram uma só linha com a contagem; as linhas
+                # saem em uma única escrita.
+                lines = []
+                for (ok, info), group in itertools.groupby(results):
+                    n = sum(1 for _ in group)
+                    tag = "[JOB OK]" if ok else "[JOB ERR]"
+                    lines.append(f"{tag} {info}\n" if n == 1 else f"{tag} {info} ({n} jobs)\n")
+                sys.stdout.write("".join(lines))
+
+        threading.Thread(target=_consume, daemon=True).start()
+        if block:
+            _produce()
+        else:
+            threading.Thread(target=_produce, daemon=True).start()
+
+    def close(self) -> None:
+        """Encerra os streams com os peers e os canais (cancela RPCs ainda em voo)."""
+        for link in self._peer_links:
+            link.close()
+        for ch in self._channel_cache.values():
+            ch.close()
 
     # ==========================
     # Servidor gRPC do cliente
     # ==========================
     def serve(self):
         """Sobe o servidor gRPC (MutualExclusionService) local do cliente."""
-        server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+        executor = futures.ThreadPoolExecutor(
+            max_workers=self.grpc_threads,
+            thread_name_prefix=f"ra-{self.client_id}",
+        )
+        server = grpc.server(
+            executor,
+            options=SERVER_OPTIONS,
+            maximum_concurrent_rpcs=self.grpc_max_pending,
+        )
         pb2_grpc.add_MutualExclusionServiceServicer_to_server(self, server)
         server.add_insecure_port(f"{self.host}:{self.port}")
         server.start()
@@ -383,6 +770,24 @@ def parse_args():
     p.add_argument("--printer", default="localhost:50051", help="Endereço do servidor de impressão")
     p.add_argument("--min-wait", type=float, default=3.0, help="Tempo mínimo entre jobs automáticos")
     p.add_argument("--max-wait", type=float, default=7.0, help="Tempo máximo entre jobs automáticos")
+    p.add_argument(
+        "--grpc-threads",
+        type=int,
+        default=None,
+        help=f"Threads do servidor RA local (default max({MIN_GRPC_THREADS}, 2 × peers + 4); mínimo nº de peers + 1)",
+    )
+    p.add_argument(
+        "--grpc-max-pending",
+        type=int,
+        default=None,
+        help="Máximo de RPCs em andamento antes de rejeitar com RESOURCE_EXHAUSTED (default 4 × (peers + 1); mínimo nº de peers + 1)",
+    )
+    p.add_argument(
+        "--max-batch",
+        type=int,
+        default=MAX_PRINT_BATCH,
+        help=f"Máximo de jobs pendentes impressos em uma mesma entrada na CS (default {MAX_PRINT_BATCH})",
+    )
     return p.parse_args()
 
 
@@ -396,17 +801,21 @@ def main() -> None:
         port=args.port,
         peers=peers,
         printer_addr=args.printer,
+        grpc_threads=args.grpc_threads,
+        grpc_max_pending=args.grpc_max_pending,
+        max_batch=args.max_batch,
     )
     server = node.serve()
 
     node.start_status_printer(interval=2.0)
-    node.start_job_generator(min_wait=args.min_wait, max_wait=args.max_wait)
 
     try:
-        while True:
-            time.sleep(3600)
+        # O gerador de jobs ocupa a thread principal, que antes só dormia. Ele apenas
+        # dorme e enfileira, então Ctrl+C o interrompe em qualquer plataforma.
+        node.start_job_generator(min_wait=args.min_wait, max_wait=args.max_wait, block=True)
     except KeyboardInterrupt:
         server.stop(0)
+        node.close()
 
 
 if __name__ == "__main__":
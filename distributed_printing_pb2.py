@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x64istributed_printing.proto\x12\x14\x64istributed_printing\"m\n\x0cPrintRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\x12\x17\n\x0fmessage_content\x18\x02 \x01(\t\x12\x19\n\x11lamport_timestamp\x18\x03 \x01(\x03\x12\x16\n\x0erequest_number\x18\x04 \x01(\x05\"Y\n\rPrintResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x1c\n\x14\x63onfirmation_message\x18\x02 \x01(\t\x12\x19\n\x11lamport_timestamp\x18\x03 \x01(\x03\"U\n\rAccessRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\x12\x19\n\x11lamport_timestamp\x18\x02 \x01(\x03\x12\x16\n\x0erequest_number\x18\x03 \x01(\x05\"C\n\x0e\x41\x63\x63\x65ssResponse\x12\x16\n\x0e\x61\x63\x63\x65ss_granted\x18\x01 \x01(\x08\x12\x19\n\x11lamport_timestamp\x18\x02 \x01(\x03\"U\n\rAccessRelease\x12\x11\n\tclient_id\x18\x01 \x01(\x05\x12\x19\n\x11lamport_timestamp\x18\x02 \x01(\x03\x12\x16\n\x0erequest_number\x18\x03 \x01(\x05\"\x07\n\x05\x45mpty2k\n\x0fPrintingService\x12X\n\rSendToPrinter\x12\".distributed_printing.PrintRequest\x1a#.distributed_printing.PrintResponse2\xc7\x01\n\x16MutualExclusionService\x12Z\n\rRequestAccess\x12#.distributed_printing.AccessRequest\x1a$.distributed_printing.AccessResponse\x12Q\n\rReleaseAccess\x12#.distributed_printing.AccessRelease\x1a\x1b.distributed_printing.Emptyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x64istributed_printing.proto\x12\x14\x64istributed_printing\"m\n\x0cPrintRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\x12\x17\n\x0fmessage_content\x18\x02 \x01(\t\x12\x19\n\x11lamport_timestamp\x18\x03 \x01(\x03\x12\x16\n\x0erequest_number\x18\x04 \x01(\x05\"Y\n\rPrintResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x1c\n\x14\x63onfirmation_message\x18\x02 \x01(\t\x12\x19\n\x11lamport_timestamp\x18\x03 \x01(\x03\"o\n\x12PrintBatchResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07printed\x18\x02 \x01(\x05\x12\x1c\n\x14\x63onfirmation_message\x18\x03 \x01(\t\x12\x19\n\x11lamport_timestamp\x18\x04 \x01(\x03\"U\n\rAccessRequest\x12\x11\n\tclient_id\x18\x01 \x01(\x05\x12\x19\n\x11lamport_timestamp\x18\x02 \x01(\x03\x12\x16\n\x0erequest_number\x18\x03 \x01(\x05\"C\n\x0e\x41\x63\x63\x65ssResponse\x12\x16\n\x0e\x61\x63\x63\x65ss_granted\x18\x01 \x01(\x08\x12\x19\n\x11lamport_timestamp\x18\x02 \x01(\x03\"U\n\rAccessRelease\x12\x11\n\tclient_id\x18\x01 \x01(\x05\x12\x19\n\x11lamport_timestamp\x18\x02 \x01(\x03\x12\x16\n\x0erequest_number\x18\x03 \x01(\x05\"\xc0\x01\n\x0cMutexMessage\x12\x36\n\x07request\x18\x01 \x01(\x0b\x32#.distributed_printing.AccessRequestH\x00\x12\x36\n\x07release\x18\x02 \x01(\x0b\x32#.distributed_printing.AccessReleaseH\x00\x12\x38\n\x08response\x18\x03 \x01(\x0b\x32$.distributed_printing.AccessResponseH\x00\x42\x06\n\x04\x62ody\"\x07\n\x05\x45mpty2\xd0\x01\n\x0fPrintingService\x12X\n\rSendToPrinter\x12\".distributed_printing.PrintRequest\x1a#.distributed_printing.PrintResponse\x12\x63\n\x11SendManyToPrinter\x12\".distributed_printing.PrintRequest\x1a(.distributed_printing.PrintBatchResponse(\x01\x32\xa2\x02\n\x16MutualExclusionService\x12Z\n\rRequestAccess\x12#.distributed_printing.AccessRequest\x1a$.distributed_printing.AccessResponse\x12Q\n\rReleaseAccess\x12#.distributed_printing.AccessRelease\x1a\x1b.distributed_printing.Empty\x12Y\n\x0bMutexStream\x12\".distributed_printing.MutexMessage\x1a\".distributed_printing.MutexMessage(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,16 +35,20 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_PRINTREQUEST']._serialized_end=161
   _globals['_PRINTRESPONSE']._serialized_start=163
   _globals['_PRINTRESPONSE']._serialized_end=252
-  _globals['_ACCESSREQUEST']._serialized_start=254
-  _globals['_ACCESSREQUEST']._serialized_end=339
-  _globals['_ACCESSRESPONSE']._serialized_start=341
-  _globals['_ACCESSRESPONSE']._serialized_end=408
-  _globals['_ACCESSRELEASE']._serialized_start=410
-  _globals['_ACCESSRELEASE']._serialized_end=495
-  _globals['_EMPTY']._serialized_start=497
-  _globals['_EMPTY']._serialized_end=504
-  _globals['_PRINTINGSERVICE']._serialized_start=506
-  _globals['_PRINTINGSERVICE']._serialized_end=613
-  _globals['_MUTUALEXCLUSIONSERVICE']._serialized_start=616
-  _globals['_MUTUALEXCLUSIONSERVICE']._serialized_end=815
+  _globals['_PRINTBATCHRESPONSE']._serialized_start=254
+  _globals['_PRINTBATCHRESPONSE']._serialized_end=365
+  _globals['_ACCESSREQUEST']._serialized_start=367
+  _globals['_ACCESSREQUEST']._serialized_end=452
+  _globals['_ACCESSRESPONSE']._serialized_start=454
+  _globals['_ACCESSRESPONSE']._serialized_end=521
+  _globals['_ACCESSRELEASE']._serialized_start=523
+  _globals['_ACCESSRELEASE']._serialized_end=608
+  _globals['_MUTEXMESSAGE']._serialized_start=611
+  _globals['_MUTEXMESSAGE']._serialized_end=803
+  _globals['_EMPTY']._serialized_start=805
+  _globals['_EMPTY']._serialized_end=812
+  _globals['_PRINTINGSERVICE']._serialized_start=815
+  _globals['_PRINTINGSERVICE']._serialized_end=1023
+  _globals['_MUTUALEXCLUSIONSERVICE']._serialized_start=1026
+  _globals['_MUTUALEXCLUSIONSERVICE']._serialized_end=1316
 # @@protoc_insertion_point(module_scope)
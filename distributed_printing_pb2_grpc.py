@@ -40,6 +40,11 @@ class PrintingServiceStub(object):
                 request_serializer=distributed__printing__pb2.PrintRequest.SerializeToString,
                 response_deserializer=distributed__printing__pb2.PrintResponse.FromString,
                 _registered_method=True)
+        self.SendManyToPrinter = channel.stream_unary(
+                '/distributed_printing.PrintingService/SendManyToPrinter',
+                request_serializer=distributed__printing__pb2.PrintRequest.SerializeToString,
+                response_deserializer=distributed__printing__pb2.PrintBatchResponse.FromString,
+                _registered_method=True)
 
 
 class PrintingServiceServicer(object):
@@ -52,6 +57,13 @@ class PrintingServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SendManyToPrinter(self, request_iterator, context):
+        """Várias impressões de uma mesma entrada na seção crítica em uma única chamada
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_PrintingServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -60,6 +72,11 @@ def add_PrintingServiceServicer_to_server(servicer, server):
                     request_deserializer=distributed__printing__pb2.PrintRequest.FromString,
                     response_serializer=distributed__printing__pb2.PrintResponse.SerializeToString,
             ),
+            'SendManyToPrinter': grpc.stream_unary_rpc_method_handler(
+                    servicer.SendManyToPrinter,
+                    request_deserializer=distributed__printing__pb2.PrintRequest.FromString,
+                    response_serializer=distributed__printing__pb2.PrintBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_printing.PrintingService', rpc_method_handlers)
@@ -99,6 +116,33 @@ class PrintingService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SendManyToPrinter(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/distributed_printing.PrintingService/SendManyToPrinter',
+            distributed__printing__pb2.PrintRequest.SerializeToString,
+            distributed__printing__pb2.PrintBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class MutualExclusionServiceStub(object):
     """Serviços entre CLIENTES (cada cliente expõe isso)
@@ -120,6 +164,11 @@ class MutualExclusionServiceStub(object):
                 request_serializer=distributed__printing__pb2.AccessRelease.SerializeToString,
                 response_deserializer=distributed__printing__pb2.Empty.FromString,
                 _registered_method=True)
+        self.MutexStream = channel.stream_stream(
+                '/distributed_printing.MutualExclusionService/MutexStream',
+                request_serializer=distributed__printing__pb2.MutexMessage.SerializeToString,
+                response_deserializer=distributed__printing__pb2.MutexMessage.FromString,
+                _registered_method=True)
 
 
 class MutualExclusionServiceServicer(object):
@@ -138,6 +187,14 @@ class MutualExclusionServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def MutexStream(self, request_iterator, context):
+        """Stream persistente entre dois clientes: pedidos e liberações seguem em ordem
+        pelo mesmo stream; a resposta de cada pedido volta na ordem dos pedidos.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MutualExclusionServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -151,6 +208,11 @@ def add_MutualExclusionServiceServicer_to_server(servicer, server):
                     request_deserializer=distributed__printing__pb2.AccessRelease.FromString,
                     response_serializer=distributed__printing__pb2.Empty.SerializeToString,
             ),
+            'MutexStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.MutexStream,
+                    request_deserializer=distributed__printing__pb2.MutexMessage.FromString,
+                    response_serializer=distributed__printing__pb2.MutexMessage.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'distributed_printing.MutualExclusionService', rpc_method_handlers)
@@ -216,3 +278,30 @@ class MutualExclusionService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def MutexStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/distributed_printing.MutualExclusionService/MutexStream',
+            distributed__printing__pb2.MutexMessage.SerializeToString,
+            distributed__printing__pb2.MutexMessage.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,3 +1,4 @@
+import argparse
 import time
 import random
 from concurrent import futures
@@ -8,22 +9,53 @@ import distributed_printing_pb2_grpc as pb2_grpc
 
 
 class PrintingService(pb2_grpc.PrintingServiceServicer):
+    def __init__(self, delay_min=2.0, delay_max=3.0):
+        self.delay_min = delay_min
+        self.delay_max = delay_max
+
+    def _print(self, request):
+        # Simula impressão (default 2–3s); com os dois limites em 0 não dorme
+        delay = random.uniform(self.delay_min, self.delay_max) if self.delay_max > 0 else 0.0
+        print(f"[TS: {request.lamport_timestamp}] CLIENTE {request.client_id}: {request.message_content} (req #{request.request_number})")
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
     def SendToPrinter(self, request, context):
-        # Simula impressão (2–3s)
-        delay = random.uniform(2.0, 3.0)
-        ts = request.lamport_timestamp
-        print(f"[TS: {ts}] CLIENTE {request.client_id}: {request.message_content} (req #{request.request_number})")
-        time.sleep(delay)
+        delay = self._print(request)
         return pb2.PrintResponse(
             success=True,
             confirmation_message=f"Impresso com sucesso em {delay:.2f}s",
+            lamport_timestamp=request.lamport_timestamp
+        )
+
+    def SendManyToPrinter(self, request_iterator, context):
+        # Lote de uma mesma entrada na CS: imprime na ordem de chegada
+        printed = 0
+        total = 0.0
+        ts = 0
+        for request in request_iterator:
+            total += self._print(request)
+            printed += 1
+            ts = request.lamport_timestamp
+        return pb2.PrintBatchResponse(
+            success=True,
+            printed=printed,
+            confirmation_message=f"{printed} impressões com sucesso em {total:.2f}s",
             lamport_timestamp=ts
         )
 
 
-def serve(host="0.0.0.0", port=50051):
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=16))
-    pb2_grpc.add_PrintingServiceServicer_to_server(PrintingService(), server)
+def serve(host="0.0.0.0", port=50051, delay_min=2.0, delay_max=3.0):
+    # Aceita os pings de keepalive dos clientes mesmo com o canal ocioso
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=16),
+        options=[
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.min_ping_interval_without_data_ms", 5000),
+        ],
+    )
+    pb2_grpc.add_PrintingServiceServicer_to_server(PrintingService(delay_min, delay_max), server)
     server.add_insecure_port(f"{host}:{port}")
     server.start()
     print(f"Servidor de impressão burro rodando em {host}:{port}")
@@ -33,5 +65,31 @@ def serve(host="0.0.0.0", port=50051):
         server.stop(0)
 
 
+def parse_args():
+    """Argumentos de linha de comando do servidor de impressão."""
+    p = argparse.ArgumentParser(description="Servidor de impressão burro")
+    p.add_argument("--host", default="0.0.0.0", help="Host de bind (default 0.0.0.0)")
+    p.add_argument("--port", type=int, default=50051, help="Porta do servidor (default 50051)")
+    p.add_argument(
+        "--simulate-delay-min",
+        type=float,
+        default=2.0,
+        help="Tempo mínimo simulado de impressão em segundos (default 2.0)",
+    )
+    p.add_argument(
+        "--simulate-delay-max",
+        type=float,
+        default=3.0,
+        help="Tempo máximo simulado de impressão em segundos (default 3.0; 0 e 0 = sem espera)",
+    )
+    args = p.parse_args()
+    if args.simulate_delay_min < 0 or args.simulate_delay_max < 0:
+        p.error("os atrasos simulados devem ser >= 0")
+    if args.simulate_delay_max < args.simulate_delay_min:
+        p.error("--simulate-delay-max deve ser >= --simulate-delay-min")
+    return args
+
+
 if __name__ == "__main__":
-    serve()
+    args = parse_args()
+    serve(args.host, args.port, args.simulate_delay_min, args.simulate_delay_max)